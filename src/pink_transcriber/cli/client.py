@@ -8,80 +8,170 @@ from __future__ import annotations
 
 import argparse
 import os
+import stat
 import sys
 import socket
 from pathlib import Path
+from typing import Iterable, Optional
 
 from pink_transcriber import __version__
 from pink_transcriber.config import (
-    SUPPORTED_AUDIO_FORMATS, SOCKET_PATH, IS_WINDOWS, TCP_HOST, TCP_PORT
+    SUPPORTED_AUDIO_FORMATS, SUPPORTED_AUDIO_FORMATS_SORTED, SOCKET_PATH, IS_WINDOWS, TCP_HOST, TCP_PORT,
+    CONNECT_TIMEOUT, CLIENT_RECV_BUFFER, TCP_RECVBUF, TCP_SENDBUF
 )
 
+# Read buffer for server responses; the buffered reader fills it with
+# readinto(), so a typical transcription arrives in a single recv
+_RECV_BUFFER_SIZE = 65536
 
-def validate_audio_file(file_path: str) -> None:
-    """Validate audio file before sending to server."""
-    if not os.path.exists(file_path):
-        print(f"ERROR: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
 
-    if not os.path.isfile(file_path):
-        print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
-        sys.exit(1)
+def _audio_file_error(file_path: str) -> Optional[str]:
+    """Return why an audio file can't be sent to the server, or None if valid."""
+    path = Path(file_path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
+    except OSError as e:
+        # e.g. NotADirectoryError, PermissionError, name too long
+        return f"Cannot access file: {file_path} ({e.strerror})"
+
+    if not stat.S_ISREG(st.st_mode):
+        return f"Not a file: {file_path}"
 
-    ext = os.path.splitext(file_path)[1].lower()
+    ext = path.suffix.lower()
     if ext not in SUPPORTED_AUDIO_FORMATS:
-        print(f"ERROR: Unsupported format: {ext}", file=sys.stderr)
-        supported_list = ', '.join(sorted(SUPPORTED_AUDIO_FORMATS))
-        print(f"Supported formats: {supported_list}", file=sys.stderr)
+        return f"Unsupported format: {ext} (supported: {SUPPORTED_AUDIO_FORMATS_SORTED})"
+
+    return None
+
+
+def validate_audio_file(file_path: str) -> None:
+    """Validate audio file before sending to server."""
+    if error := _audio_file_error(file_path):
+        print(f"ERROR: {error}", file=sys.stderr)
         sys.exit(1)
 
 
-def connect_to_server() -> socket.socket:
-    """Create and connect socket to server (platform-specific)."""
+def connect_to_server(
+    socket_options: Optional[Iterable[tuple[int, int, int]]] = None
+) -> socket.socket:
+    """
+    Create and connect socket to server (platform-specific).
+
+    Args:
+        socket_options: Extra (level, option, value) tuples applied to the
+            TCP socket on Windows, e.g. (SOL_SOCKET, SO_KEEPALIVE, 1).
+            Ignored for Unix domain sockets.
+    """
     if IS_WINDOWS:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Explicit buffer sizes: replies are short, avoid throughput-tuned queuing
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TCP_RECVBUF or CLIENT_RECV_BUFFER)
+        if TCP_SENDBUF:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SENDBUF)
+        sock.settimeout(CONNECT_TIMEOUT)
         sock.connect((TCP_HOST, TCP_PORT))
+        # Disable Nagle: requests are a single small write followed by a read
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for level, option, value in socket_options or ():
+            sock.setsockopt(level, option, value)
     else:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
         sock.connect(str(SOCKET_PATH))
+    # Transcription can take a while, so only the connect is time-limited
+    sock.settimeout(None)
     return sock
 
 
+def _send_path(sock: socket.socket, audio_path: str) -> None:
+    """Send one request line (gathered write avoids building a joined copy)."""
+    parts = [audio_path.encode(), b'\n']
+    if hasattr(sock, 'sendmsg'):
+        sent = sock.sendmsg(parts)
+        if sent < len(parts[0]) + 1:
+            sock.sendall(b''.join(parts)[sent:])
+    else:
+        sock.sendall(b''.join(parts))
+
+
+def _parse_response(line: bytes) -> str:
+    """Decode a response line, raising RuntimeError for server errors."""
+    if not line:
+        raise ConnectionResetError("Server closed connection without a response")
+
+    # Status byte is checked before decoding the (possibly large) payload
+    status = line[:1]
+    if status == b'E':
+        raise RuntimeError(line[1:].decode().strip())
+    if status == b'T':
+        return line[1:].decode().strip()
+
+    raise RuntimeError(f"Unexpected response from server: {line[:50]!r}")
+
+
 def transcribe(audio_path: str) -> str:
     """Send audio file to server and receive transcription."""
     sock = connect_to_server()
 
     try:
-        # Send audio path
-        sock.sendall(audio_path.encode() + b'\n')
+        _send_path(sock, audio_path)
+
+        # Receive transcription result: one newline-terminated line, scanned in C
+        with sock.makefile('rb', buffering=_RECV_BUFFER_SIZE) as rfile:
+            line = rfile.readline()
+
+    finally:
+        sock.close()
+
+    return _parse_response(line)
+
 
-        # Receive transcription result
-        response = b''
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            response += chunk
-            if response.endswith(b'\n'):
-                break
+def transcribe_batch(audio_paths: Iterable[str]) -> int:
+    """
+    Transcribe several files over a single connection.
 
-        text = response.decode().strip()
+    Prints one stdout line per input path (empty for failures) so results
+    stay aligned with the input, and each failure to stderr.
 
-        if text.startswith("ERROR:"):
-            raise RuntimeError(text[7:])
+    Returns:
+        Number of files that failed to transcribe.
+    """
+    failures = 0
+    sock = connect_to_server()
 
-        return text
+    try:
+        with sock.makefile('rb', buffering=_RECV_BUFFER_SIZE) as rfile:
+            for audio_path in audio_paths:
+                if error := _audio_file_error(audio_path):
+                    print(f"ERROR: {audio_path}: {error}", file=sys.stderr)
+                    print(flush=True)
+                    failures += 1
+                    continue
+
+                _send_path(sock, audio_path)
+                line = rfile.readline()
+
+                try:
+                    print(_parse_response(line), flush=True)
+                except RuntimeError as e:
+                    print(f"ERROR: {audio_path}: {e}", file=sys.stderr)
+                    print(flush=True)
+                    failures += 1
 
     finally:
         sock.close()
 
+    return failures
+
 
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
         prog='pink-transcriber',
         description='Voice transcription using faster-whisper',
-        epilog='Supported formats: ' + ', '.join(sorted(SUPPORTED_AUDIO_FORMATS))
+        epilog=f'Supported formats: {SUPPORTED_AUDIO_FORMATS_SORTED}'
     )
 
     parser.add_argument(
@@ -99,6 +189,11 @@ def main() -> None:
         action='store_true',
         help='Check if transcription server is running'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Read audio file paths from stdin (one per line) and reuse one connection'
+    )
 
     args = parser.parse_args()
 
@@ -117,7 +212,8 @@ def main() -> None:
             sock.sendall(b"HEALTH\n")
 
             # Receive response
-            response = sock.recv(1024).decode().strip()
+            with sock.makefile('rb', buffering=_RECV_BUFFER_SIZE) as rfile:
+                response = rfile.readline().decode().strip()
             sock.close()
 
             if response == "OK":
@@ -140,6 +236,25 @@ def main() -> None:
             print(f"ERROR: Server not responding: {e}", file=sys.stderr)
             sys.exit(1)
 
+    # Batch mode: many files over one connection
+    if args.batch:
+        if not IS_WINDOWS and SOCKET_PATH and not SOCKET_PATH.exists():
+            print("ERROR: Server not running", file=sys.stderr)
+            sys.exit(1)
+
+        audio_paths = (os.path.abspath(line.strip()) for line in sys.stdin if line.strip())
+
+        try:
+            failures = transcribe_batch(audio_paths)
+        except ConnectionRefusedError:
+            print("ERROR: Server not running", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        sys.exit(1 if failures else 0)
+
     # Require audio file if not health check
     if not args.audio_file:
         parser.print_help()
@@ -15,9 +15,13 @@ except ImportError:
 
 import asyncio
 import signal
+import socket
 from typing import Any
 
-from pink_transcriber.config import VERBOSE_MODE, SOCKET_PATH, IS_WINDOWS, TCP_HOST, TCP_PORT
+from pink_transcriber.config import (
+    VERBOSE_MODE, SOCKET_PATH, IS_WINDOWS, TCP_HOST, TCP_PORT,
+    TCP_BACKLOG, TCP_RECVBUF, TCP_SENDBUF
+)
 from pink_transcriber.core import model
 from pink_transcriber.daemon import worker
 from pink_transcriber.daemon.singleton import ensure_single_instance
@@ -45,7 +49,16 @@ async def main() -> None:
     # Create server (platform-specific)
     if IS_WINDOWS:
         # Windows: TCP server on localhost
-        server = await asyncio.start_server(client_handler, TCP_HOST, TCP_PORT)
+        # Buffer sizes are set before bind so accepted connections inherit them
+        listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if TCP_RECVBUF:
+            listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TCP_RECVBUF)
+        if TCP_SENDBUF:
+            listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SENDBUF)
+        listen_sock.bind((TCP_HOST, TCP_PORT))
+        server = await asyncio.start_server(
+            client_handler, sock=listen_sock, backlog=TCP_BACKLOG
+        )
         if VERBOSE_MODE:
             print(f"✓ Server listening on TCP", flush=True)
             print(f"  Address: {TCP_HOST}:{TCP_PORT}", flush=True)
@@ -55,7 +68,9 @@ async def main() -> None:
         socket_path = SOCKET_PATH
         if socket_path.exists():
             socket_path.unlink()
-        server = await asyncio.start_unix_server(client_handler, path=str(socket_path))
+        server = await asyncio.start_unix_server(
+            client_handler, path=str(socket_path), backlog=TCP_BACKLOG
+        )
         if VERBOSE_MODE:
             print(f"✓ Server listening on Unix socket", flush=True)
             print(f"  Socket: {socket_path}", flush=True)
@@ -92,6 +107,10 @@ async def main() -> None:
         # Run until shutdown signal
         await shutdown_event.wait()
 
+        # Stop accepting new connections and reject new requests
+        server.close()
+        worker.begin_shutdown()
+
         # Stop worker with sentinel
         await queue.put(None)
         try:
@@ -103,8 +122,8 @@ async def main() -> None:
             except asyncio.CancelledError:
                 pass
 
-        # Stop accepting new connections
-        server.close()
+        # Close remaining connections (wait_closed() waits for them on 3.12+)
+        await worker.close_clients()
         await server.wait_closed()
 
         # Remove socket (Unix only)
@@ -1,9 +1,26 @@
 """Configuration and constants for pink-transcriber."""
 
+import functools
 import os
 import sys
 from pathlib import Path
 
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Read integer env var, falling back to default if malformed or too small."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = None
+    if parsed is None or parsed < minimum:
+        print(f"WARNING: Invalid {name}={value!r}, using {default}", file=sys.stderr)
+        return default
+    return parsed
+
+
 # Platform detection
 IS_WINDOWS = sys.platform == 'win32'
 
@@ -19,11 +36,35 @@ else:
     TCP_HOST = None
     TCP_PORT = None
 
+# Client connect timeout in seconds (fail fast if server is wedged)
+CONNECT_TIMEOUT = 5
+
+# Client TCP receive buffer size in bytes when TCP_RECVBUF is unset (replies are small)
+CLIENT_RECV_BUFFER = 32768
+
+# Socket tuning (buffer sizes in bytes; 0 keeps the OS default)
+TCP_BACKLOG = _env_int('PINK_TRANSCRIBER_TCP_BACKLOG', 128, minimum=1)
+TCP_RECVBUF = _env_int('PINK_TRANSCRIBER_TCP_RECVBUF', 0, minimum=0) or None
+TCP_SENDBUF = _env_int('PINK_TRANSCRIBER_TCP_SNDBUF', 0, minimum=0) or None
+
 # Supported audio formats
 SUPPORTED_AUDIO_FORMATS = frozenset({
     '.aiff', '.flac', '.m4a', '.mp3', '.ogg', '.opus', '.wav'
 })
 
+# Display string for help text and error messages
+SUPPORTED_AUDIO_FORMATS_SORTED = ', '.join(sorted(SUPPORTED_AUDIO_FORMATS))
+
+# Model precision (CTranslate2 compute types)
+SUPPORTED_COMPUTE_TYPES = frozenset({'float16', 'int8_float16', 'int8', 'bfloat16'})
+COMPUTE_TYPE_CUDA = os.getenv('PINK_TRANSCRIBER_COMPUTE_TYPE', 'int8_float16')
+COMPUTE_TYPE_CPU = os.getenv('PINK_TRANSCRIBER_COMPUTE_TYPE_CPU', 'int8')
+
+# Decoding settings (greedy by default; VAD skips non-speech audio)
+BEAM_SIZE = _env_int('PINK_TRANSCRIBER_BEAM_SIZE', 1, minimum=1)
+LANGUAGE = os.getenv('PINK_TRANSCRIBER_LANGUAGE') or None
+VAD_MIN_SILENCE_MS = 500
+
 # Verbose mode flag (enable detailed logging)
 VERBOSE_MODE = os.getenv('VERBOSE') == '1'
 
@@ -35,6 +76,19 @@ if os.getenv('DEV') == '1':
     VERBOSE_MODE = True
 
 
+def _is_writable(path: Path) -> bool:
+    """Check directory can be created and written to."""
+    try:
+        path.mkdir(exist_ok=True)
+        test_file = path / ".write_test"
+        test_file.touch()
+        test_file.unlink()
+        return True
+    except (PermissionError, OSError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def get_model_cache_dir() -> Path:
     """
     Get model cache directory path.
@@ -43,6 +97,8 @@ def get_model_cache_dir() -> Path:
     1. PINK_TRANSCRIBER_MODEL_DIR environment variable
     2. Package directory (./models/) if writable
     3. Fallback: ~/.local/share/pink-transcriber/models
+
+    Result is cached, so the directory is created and probed only once.
     """
     # 1. Environment override
     if custom := os.getenv('PINK_TRANSCRIBER_MODEL_DIR'):
@@ -54,15 +110,8 @@ def get_model_cache_dir() -> Path:
     package_dir = Path(__file__).resolve().parent.parent.parent
     models_dir = package_dir / "models"
 
-    # Test if writable
-    try:
-        models_dir.mkdir(exist_ok=True)
-        test_file = models_dir / ".write_test"
-        test_file.touch()
-        test_file.unlink()
+    if _is_writable(models_dir):
         return models_dir
-    except (PermissionError, OSError):
-        pass
 
     # 3. Fallback: user data directory
     if IS_WINDOWS:
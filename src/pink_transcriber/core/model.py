@@ -4,118 +4,233 @@ Model loading and transcription logic using faster-whisper.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from pink_transcriber.config import VERBOSE_MODE, get_model_cache_dir, IS_WINDOWS
+from pink_transcriber.config import (
+    VERBOSE_MODE, get_model_cache_dir, IS_WINDOWS,
+    SUPPORTED_COMPUTE_TYPES, COMPUTE_TYPE_CUDA, COMPUTE_TYPE_CPU,
+    BEAM_SIZE, LANGUAGE, VAD_MIN_SILENCE_MS
+)
 
-_model: Optional[any] = None
-_device: str = "cuda"
-_compute_type: str = "float16"
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+
+class _State:
+    """Loaded model and its device settings."""
+    __slots__ = ('model', 'device', 'compute_type')
+
+    def __init__(self) -> None:
+        self.model: Optional["WhisperModel"] = None
+        self.device: str = "cuda"
+        self.compute_type: str = COMPUTE_TYPE_CUDA
+
+
+_state = _State()
+
+# CUDA shared libraries are dlopen'ed once per process
+_cuda_libs_loaded: bool = False
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Check CUDA availability once (torch import and CUDA init are slow)."""
+    import torch
+    return torch.cuda.is_available()
+
+
+def _warmup(model: "WhisperModel") -> None:
+    """Run dummy transcriptions so CUDA/cuDNN and VAD lazy init happens at startup."""
+    import numpy as np
+
+    # 1 second of silence at 16 kHz; faster-whisper accepts ndarrays directly
+    audio = np.zeros(16000, dtype=np.float32)
+
+    try:
+        # Same options as real requests: loads the Silero VAD model
+        segments, _ = model.transcribe(
+            audio,
+            beam_size=BEAM_SIZE,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=VAD_MIN_SILENCE_MS),
+            language=LANGUAGE,
+            condition_on_previous_text=False,
+        )
+        list(segments)
+
+        # VAD drops pure silence, so run once without it to exercise the encoder/decoder
+        segments, _ = model.transcribe(
+            audio,
+            beam_size=BEAM_SIZE,
+            vad_filter=False,
+            language=LANGUAGE,
+            condition_on_previous_text=False,
+        )
+        list(segments)
+    except Exception as e:
+        if VERBOSE_MODE:
+            print(f"WARNING: Warm-up failed: {e}", flush=True)
+
+
+# Files faster-whisper needs to load large-v3 (preprocessor_config.json sets 128 mel bins)
+_SNAPSHOT_REQUIRED_FILES = ("model.bin", "config.json", "preprocessor_config.json", "tokenizer.json")
+
+
+def _has_complete_snapshot(model_cache_dir: Path) -> bool:
+    """Check a downloaded large-v3 snapshot has every file needed to load it."""
+    snapshots_dir = model_cache_dir / "models--Systran--faster-whisper-large-v3" / "snapshots"
+    if not snapshots_dir.is_dir():
+        return False
+
+    # An interrupted download can leave model.bin without the other files
+    for snapshot in snapshots_dir.iterdir():
+        if (
+            all((snapshot / name).is_file() for name in _SNAPSHOT_REQUIRED_FILES)
+            and any(snapshot.glob("vocabulary.*"))
+        ):
+            return True
+    return False
 
 
 def load_model() -> None:
-    """Load Whisper Large-v3 model with CUDA FP16 support."""
-    global _model, _device, _compute_type
+    """Load Whisper Large-v3 model on CUDA (INT8 weights, FP16 activations by default)."""
+    # Already loaded (e.g. repeated call on reload)
+    if _state.model is not None:
+        return
 
     # Set cache directory
     model_cache_dir = get_model_cache_dir()
-    model_cache_dir.mkdir(exist_ok=True, parents=True)
 
     # Configure cache paths
     os.environ['HF_HOME'] = str(model_cache_dir / "huggingface")
     os.environ['XDG_CACHE_HOME'] = str(model_cache_dir)
 
     # Load CUDA libraries (Linux only - on Windows CUDA is installed system-wide)
-    if not IS_WINDOWS:
+    global _cuda_libs_loaded
+    if not IS_WINDOWS and not _cuda_libs_loaded:
         try:
             import ctypes
             import nvidia.cudnn, nvidia.cublas
             for m in [nvidia.cudnn, nvidia.cublas]:
                 lib_dir = os.path.join(m.__path__[0], "lib")
-                for f in os.listdir(lib_dir):
-                    if '.so' in f:
-                        try:
-                            ctypes.CDLL(os.path.join(lib_dir, f), mode=ctypes.RTLD_GLOBAL)
-                        except:
-                            pass
+                # Load one file per library (libX.so, libX.so.9, libX.so.9.1.0 -> libX.so);
+                # sorting puts the shortest (least versioned) name first, and a file
+                # that fails (e.g. dangling dev symlink) falls through to the next one
+                loaded = set()
+                for f in sorted(os.listdir(lib_dir)):
+                    if not (f.endswith('.so') or '.so.' in f):
+                        continue
+                    base = f[:f.index('.so') + 3]
+                    if base in loaded:
+                        continue
+                    try:
+                        ctypes.CDLL(os.path.join(lib_dir, f), mode=ctypes.RTLD_GLOBAL)
+                        loaded.add(base)
+                    except:
+                        pass
         except:
             pass
+        _cuda_libs_loaded = True
 
     try:
         from faster_whisper import WhisperModel
-        import torch
 
         if VERBOSE_MODE:
             print("Loading Whisper Large-v3 model with faster-whisper...", flush=True)
 
         # Check CUDA availability
-        if not torch.cuda.is_available():
-            _device = "cpu"
-            _compute_type = "int8"
+        if not _cuda_available():
+            _state.device = "cpu"
+            _state.compute_type = COMPUTE_TYPE_CPU
             if VERBOSE_MODE:
                 print("WARNING: CUDA not available, using CPU", flush=True)
         else:
-            _device = "cuda"
-            _compute_type = "float16"
+            _state.device = "cuda"
+            _state.compute_type = COMPUTE_TYPE_CUDA
             if VERBOSE_MODE:
+                import torch
                 gpu_name = torch.cuda.get_device_name(0)
                 print(f"✓ GPU: {gpu_name}", flush=True)
 
-        # Load the model on GPU with FP16 precision
-        _model = WhisperModel(
+        if _state.compute_type not in SUPPORTED_COMPUTE_TYPES:
+            supported_list = ', '.join(sorted(SUPPORTED_COMPUTE_TYPES))
+            raise ValueError(f"Unsupported compute type: {_state.compute_type} (supported: {supported_list})")
+
+        # Skip the HuggingFace update check when the model is already downloaded
+        local_files_only = _has_complete_snapshot(model_cache_dir)
+
+        # Load the model (single worker: requests are processed sequentially)
+        whisper_model = WhisperModel(
             "large-v3",
-            device=_device,
-            compute_type=_compute_type,
+            device=_state.device,
+            compute_type=_state.compute_type,
             download_root=str(model_cache_dir),
+            local_files_only=local_files_only,
+            num_workers=1,
+            cpu_threads=0,
         )
 
+        # Publish only after warm-up so HEALTH reports LOADING until then
+        _warmup(whisper_model)
+        _state.model = whisper_model
+
         if VERBOSE_MODE:
-            print(f"✓ Model loaded on {_device.upper()} ({_compute_type.upper()})", flush=True)
+            print(f"✓ Model loaded on {get_device()}", flush=True)
 
     except Exception as e:
         print(f"\nERROR: {e}\n", file=sys.stderr)
         sys.exit(1)
 
 
-def transcribe(audio_path: str) -> str:
-    """Transcribe audio file to text using faster-whisper."""
-    if _model is None:
+def transcribe_stream(audio_path: str) -> Iterator[str]:
+    """Transcribe audio file, yielding segment texts as they are decoded."""
+    model = _state.model
+    if model is None:
         raise RuntimeError("Model not loaded")
 
-    if not os.path.exists(audio_path):
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
     try:
-        segments, info = _model.transcribe(
+        segments, info = model.transcribe(
             audio_path,
-            beam_size=5,
-            vad_filter=False,
-            language=None,
+            beam_size=BEAM_SIZE,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=VAD_MIN_SILENCE_MS),
+            language=LANGUAGE,
+            condition_on_previous_text=False,
         )
 
-        # Collect all segments
-        text_segments = []
+        if VERBOSE_MODE:
+            print(f"  Language: {info.language} ({info.language_probability:.2f})", flush=True)
+
+        # Segments are decoded lazily by faster-whisper
         for segment in segments:
-            text_segments.append(segment.text)
+            yield segment.text
 
-        result = " ".join(text_segments).strip()
+    except FileNotFoundError:
+        # Raised by the audio decoder when it opens the file
+        raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
 
-        if VERBOSE_MODE:
-            print(f"  Language: {info.language} ({info.language_probability:.2f})", flush=True)
 
-        return result if result else ""
+def transcribe(audio_path: str) -> str:
+    """Transcribe audio file to text using faster-whisper."""
+    # Build encoded text incrementally instead of holding a list of segments
+    buf = bytearray()
+    for text in transcribe_stream(audio_path):
+        if buf:
+            buf.append(0x20)  # space
+        buf.extend(text.encode('utf-8'))
 
-    except Exception as e:
-        raise RuntimeError(f"Transcription failed: {e}")
+    return buf.decode('utf-8').strip()
 
 
 def get_device() -> str:
     """Get current device name."""
-    return f"{_device.upper()} ({_compute_type.upper()})"
+    return f"{_state.device.upper()} ({_state.compute_type.upper()})"
 
 
 def is_loaded() -> bool:
     """Check if model is loaded and ready."""
-    return _model is not None
+    return _state.model is not None
@@ -20,6 +20,25 @@ class TranscriptionRequest:
     result_future: asyncio.Future
 
 
+# Open connection handler tasks, cancelled on shutdown (batch clients stay connected)
+_client_tasks: set[asyncio.Task] = set()
+_shutting_down = False
+
+
+def begin_shutdown() -> None:
+    """Stop accepting new transcription requests."""
+    global _shutting_down
+    _shutting_down = True
+
+
+async def close_clients() -> None:
+    """Cancel open client connections, including idle --batch clients."""
+    tasks = list(_client_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def transcription_worker(queue: asyncio.Queue[TranscriptionRequest]) -> None:
     """Process transcription requests from queue sequentially."""
     while True:
@@ -48,45 +67,45 @@ async def transcription_worker(queue: asyncio.Queue[TranscriptionRequest]) -> No
             pass
 
 
-async def handle_client(
-    reader: asyncio.StreamReader,
-    writer: asyncio.StreamWriter,
-    queue: asyncio.Queue[TranscriptionRequest]
-) -> None:
-    """Handle incoming client connection."""
+def _frame(status: bytes, payload: str) -> bytes:
+    """Build a response line; embedded newlines would break line framing."""
+    payload = payload.replace('\r', ' ').replace('\n', ' ')
+    return status + payload.encode() + b'\n'
+
+
+async def _handle_request(data: bytes, queue: asyncio.Queue[TranscriptionRequest]) -> bytes:
+    """
+    Handle a single request line and return the response line.
+
+    Transcription responses start with a status byte: b'T' for text,
+    b'E' for an error message. Health responses are unframed.
+    """
     start_time = time.time() if VERBOSE_MODE else None
 
     try:
-        # Read command or audio file path from client
-        data = await reader.readline()
         message = data.decode().strip()
+    except UnicodeDecodeError:
+        return b"EInvalid request: path is not valid UTF-8\n"
 
-        # Handle health check command
-        if message == "HEALTH":
-            if model.is_loaded():
-                writer.write(b"OK\n")
-            else:
-                writer.write(b"LOADING\n")
-            await writer.drain()
-            writer.close()
-            await writer.wait_closed()
-            return
+    # Handle health check command
+    if message == "HEALTH":
+        return b"OK\n" if model.is_loaded() else b"LOADING\n"
 
-        # Regular transcription request
-        audio_path = message
+    # Regular transcription request
+    audio_path = message
 
-        if not audio_path:
-            error_msg = f"ERROR: No audio path provided\n".encode()
-            writer.write(error_msg)
-            await writer.drain()
-            writer.close()
-            await writer.wait_closed()
-            return
+    if not audio_path:
+        return b"ENo audio path provided\n"
 
-        if VERBOSE_MODE:
-            filename = Path(audio_path).name
-            print(f"→ Received request: {filename}", flush=True)
+    # Worker is stopping; a queued request would never be processed
+    if _shutting_down:
+        return b"EServer is shutting down\n"
 
+    if VERBOSE_MODE:
+        filename = Path(audio_path).name
+        print(f"→ Received request: {filename}", flush=True)
+
+    try:
         # Create future for result
         result_future = asyncio.Future()
 
@@ -101,36 +120,62 @@ async def handle_client(
             elapsed = time.time() - start_time
             print(f"✓ Transcribed in {elapsed:.2f}s: {text[:50]}...", flush=True)
 
-        # Send result back to client
-        response = text.encode() + b'\n'
-        writer.write(response)
-        await writer.drain()
-
-    except (BrokenPipeError, ConnectionResetError):
-        # Client disconnected - this is normal (e.g., healthcheck)
-        pass
+        return _frame(b'T', text)
 
     except FileNotFoundError as e:
         if VERBOSE_MODE:
             print(f"✗ File not found: {str(e)}", flush=True)
-        try:
-            error_msg = f"ERROR: {str(e)}\n".encode()
-            writer.write(error_msg)
-            await writer.drain()
-        except (BrokenPipeError, ConnectionResetError):
-            pass
+        return _frame(b'E', str(e))
 
     except Exception as e:
         if VERBOSE_MODE:
             print(f"✗ Error: {str(e)}", flush=True)
-        try:
-            error_msg = f"ERROR: {str(e)}\n".encode()
-            writer.write(error_msg)
+        return _frame(b'E', str(e))
+
+
+async def handle_client(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    queue: asyncio.Queue[TranscriptionRequest]
+) -> None:
+    """
+    Handle incoming client connection.
+
+    Serves one request per line until the client closes the connection,
+    so batch clients can reuse a single socket.
+    """
+    task = asyncio.current_task()
+    _client_tasks.add(task)
+
+    try:
+        while True:
+            # Read command or audio file path from client
+            try:
+                data = await reader.readline()
+            except ValueError:
+                # Line exceeded the StreamReader limit; framing is lost, so reply and close
+                writer.write(b"EInvalid request: line too long\n")
+                await writer.drain()
+                break
+            if not data:
+                break
+
+            response = await _handle_request(data, queue)
+
+            # Send result back to client
+            writer.write(response)
             await writer.drain()
-        except (BrokenPipeError, ConnectionResetError):
-            pass
+
+    except (BrokenPipeError, ConnectionResetError):
+        # Client disconnected - this is normal (e.g., healthcheck)
+        pass
+
+    except asyncio.CancelledError:
+        # Server shutdown (close_clients)
+        pass
 
     finally:
+        _client_tasks.discard(task)
         try:
             writer.close()
             await writer.wait_closed()